@@ -8,11 +8,13 @@ using System.Threading.Tasks;
 
 namespace ChopshopSignin
 {
-    class BarcodeReader
+    class BarcodeReader : IDisposable
     {
         private readonly Capture camera;
         private readonly ZXing.BarcodeReader reader;
 
+        private bool disposed = false;
+
         /// <summary>
         /// 
         /// </summary>
@@ -47,5 +49,23 @@ namespace ChopshopSignin
                 return decodeResult?.Text;
             }
         }
+
+        public void Dispose()
+        {
+            Dispose(true);
+        }
+
+        private void Dispose(bool disposing)
+        {
+            if (disposing)
+            {
+                if (!disposed)
+                {
+                    disposed = true;
+                    camera.Dispose();
+                    GC.SuppressFinalize(this);
+                }
+            }
+        }
     }
 }
@@ -4,8 +4,6 @@ using System.Windows;
 using System.Windows.Data;
 using System.Windows.Input;
 using System.Windows.Media.Imaging;
-using System.Runtime.InteropServices;
-using System.Drawing;
 
 namespace ChopshopSignin
 {
@@ -17,8 +15,7 @@ namespace ChopshopSignin
         private readonly ViewModel viewModel;
         private readonly SignInManager signInManger;
         private readonly System.Timers.Timer saveTimer;
-        private readonly Capture camera;
-        private readonly ZXing.BarcodeReader reader;
+        private readonly BarcodeReader barcodeReader;
         private readonly System.Timers.Timer captureTimer;
 
         const int VideoWidth = 640;         // Depends on video device caps
@@ -62,9 +59,7 @@ namespace ChopshopSignin
             saveTimer = new System.Timers.Timer(15 * 60 * 1000);    // 15 minutes
             captureTimer = new System.Timers.Timer(100);            // 0.1 second
 
-            camera = new Capture(Properties.Settings.Default.CameraDeviceNumber, VideoWidth, VideoHeight, VideoBitsPerPixel);
-            reader = new ZXing.BarcodeReader();
-            reader.Options.PossibleFormats = new[] { ZXing.BarcodeFormat.QR_CODE, ZXing.BarcodeFormat.CODE_128, ZXing.BarcodeFormat.CODE_39 };
+            barcodeReader = new BarcodeReader(Properties.Settings.Default.CameraDeviceNumber, VideoWidth, VideoHeight, VideoBitsPerPixel);
         }
 
         /// <summary>
@@ -97,7 +92,7 @@ namespace ChopshopSignin
 
         private void PeriodicCapture(object sender, System.Timers.ElapsedEventArgs e)
         {
-            Dispatcher.Invoke(() => signInManger.HandleScanData(ScanBarcode()));
+            Dispatcher.Invoke(() => signInManger.HandleScanData(barcodeReader.Scan()));
 
             // Restart the time for the next scan
             captureTimer.Enabled = true;
@@ -126,7 +121,7 @@ namespace ChopshopSignin
                     saveTimer.Dispose();
                     viewModel.Dispose();
                     signInManger.Dispose();
-                    camera.Dispose();
+                    barcodeReader.Dispose();
 
                     GC.SuppressFinalize(this);
                 }
@@ -206,22 +201,5 @@ namespace ChopshopSignin
                     viewModel.Background = decoder.Frames.FirstOrDefault();
                 }
         }
-
-        private string ScanBarcode()
-        {
-            // capture image
-            var rawData = camera.Click();
-
-            using (var bitmap = new Bitmap(camera.Width, camera.Height, camera.Stride, System.Drawing.Imaging.PixelFormat.Format24bppRgb, rawData))
-            {
-                var decodeResult = reader.Decode(bitmap);
-
-                // Release the buffer
-                if (rawData != IntPtr.Zero)
-                    Marshal.FreeCoTaskMem(rawData);
-
-                return decodeResult?.Text;
-            }
-        }
     }
 }
\ No newline at end of file
@@ -76,13 +76,7 @@ namespace ChopshopSignin
             if (string.IsNullOrEmpty(propName))
                 return true;
 
-            lock (_sync)
-            {
-                if (!_properties.ContainsKey(this.GetType()))
-                    _properties[this.GetType()] = GetPropertySet(this.GetType());
-            }
-
-            return _properties[GetType()].Contains(propName);
+            return _properties.GetOrAdd(GetType(), GetPropertySet).Contains(propName);
         }
 
         private static HashSet<string> GetPropertySet(Type type)
@@ -90,7 +84,6 @@ namespace ChopshopSignin
             return new HashSet<string>(type.GetProperties().Select(x => x.Name));
         }
 
-        private static readonly Dictionary<Type, HashSet<string>> _properties = new Dictionary<Type, HashSet<string>>();
-        private static readonly object _sync = new object();
+        private static readonly ConcurrentDictionary<Type, HashSet<string>> _properties = new ConcurrentDictionary<Type, HashSet<string>>();
     }
 }
@@ -13,20 +13,31 @@ namespace ChopshopSignin
 
         public string FirstName { get; private set; }
         public string LastName { get; private set; }
-        public string FullName { get { return LastName + ", " + FirstName; } }
+
+        /// <summary>
+        /// Returns the name, last name first
+        /// The names never change, so this is only built the first time it's needed
+        /// </summary>
+        public string FullName
+        {
+            get { return m_FullName = (m_FullName ?? LastName + ", " + FirstName); }
+        }
+
+        private string m_FullName;
 
         /// <summary>
         /// Returns the most recent location from today's timestamps
+        /// Timestamps are kept in time order, so only the last scan needs to be checked
         /// </summary>
         public Scan.LocationType CurrentLocation
         {
             get
             {
-                var today = Timestamps.Where(x => x.ScanTime.Date == DateTime.Today);
-                if (today.Count() == 0)
+                var lastScan = Timestamps.LastOrDefault();
+                if (lastScan == null || lastScan.ScanTime.Date != DateTime.Today)
                     return Scan.LocationType.Out;
 
-                return today.Last().Direction;
+                return lastScan.Direction;
             }
         }
 
@@ -39,17 +50,32 @@ namespace ChopshopSignin
         {
             get
             {
-                var lastInScan = Timestamps.Where(x => x.ScanTime.Date == DateTime.Today).Where(x => x.Direction == Scan.LocationType.In).LastOrDefault();
-                if (lastInScan == null)
-                    return null;
+                var today = DateTime.Today;
 
-                return lastInScan.ScanTime;
+                // Walk back through today's scans only, newest first
+                for (int i = Timestamps.Count - 1; i >= 0 && Timestamps[i].ScanTime.Date == today; i--)
+                    if (Timestamps[i].Direction == Scan.LocationType.In)
+                        return Timestamps[i].ScanTime;
+
+                return null;
             }
         }
 
         public RoleType Role { get; private set; }
 
-        public List<Scan> Timestamps { get; private set; }
+        public List<Scan> Timestamps
+        {
+            get { return m_Timestamps; }
+            private set { m_Timestamps = value; System.Threading.Interlocked.Increment(ref m_ScanVersion); }
+        }
+
+        private List<Scan> m_Timestamps;
+
+        // Incremented after every change to the scans, since that's the only time the total can change
+        private int m_ScanVersion;
+
+        // The last total calculated by GetTotalTimeSince, with the start time and scan version it was calculated for
+        private Tuple<DateTime, int, TimeSpan> m_TotalTime;
 
         private Person()
         {
@@ -80,7 +106,13 @@ namespace ChopshopSignin
 
             Role = result;
 
-            Timestamps = personXml.Element("Scans").Elements().Select(x => new Scan(x)).OrderBy(x => x.ScanTime).ToList();
+            var scans = personXml.Element("Scans").Elements().Select(x => new Scan(x)).ToList();
+
+            // Saved files are already in time order, so only sort if the file was edited out of order
+            if (!IsInTimeOrder(scans))
+                scans = scans.OrderBy(x => x.ScanTime).ToList();
+
+            Timestamps = scans;
         }
 
         public static Person Create(string scanData)
@@ -90,14 +122,16 @@ namespace ChopshopSignin
 
             RoleType role = Person.RoleType.Student;
 
-            // Check for a mentor scan
-            if (IsMentor(scanData))
+            // Check for a mentor scan, and strip the mentor ID off the name using the same match
+            var mentorId = MatchMentorId(scanData);
+            if (mentorId.Success)
             {
                 role = Person.RoleType.Mentor;
-                scanData = GetMentorName(scanData);
+                scanData = scanData.Substring(mentorId.Length);
             }
 
-            return new Person(scanData.Split(',').First(), scanData.Split(',').Last(), role);
+            var names = scanData.Split(',');
+            return new Person(names.First(), names.Last(), role);
         }
 
         public bool Equals(Person other)
@@ -115,7 +149,8 @@ namespace ChopshopSignin
 
         public override int GetHashCode()
         {
-            return FullName.GetHashCode();
+            // Must ignore case to agree with Equals
+            return StringComparer.OrdinalIgnoreCase.GetHashCode(FullName);
         }
 
         public static bool operator ==(Person a, Person b)
@@ -142,7 +177,8 @@ namespace ChopshopSignin
         /// <returns></returns>
         public SignInOutResult Toggle()
         {
-            return SignInOrOut(!IsSignedIn);
+            // The direction comes from the current location, so it can't fail the checks in SignIn/SignOut
+            return AddScan(!IsSignedIn);
         }
 
         /// <summary>
@@ -186,16 +222,28 @@ namespace ChopshopSignin
         /// <summary>
         /// Load all the people from the file
         /// This will make a backup copy in the BackupFolder folder first
+        /// The people are all created before returning, so enumerating the result more than once doesn't re-parse them
         /// </summary>
-        public static IEnumerable<Person> Load(string filePath)
+        public static IList<Person> Load(string filePath)
         {
             if (System.IO.File.Exists(filePath))
             {
                 BackupDataFile(filePath);
-                return XElement.Load(filePath).Elements().Select(x => new Person(x));
+                return XElement.Load(filePath).Elements().Select(x => new Person(x)).ToList();
             }
 
-            return Enumerable.Empty<Person>();
+            return new List<Person>();
+        }
+
+        /// <summary>
+        /// Combines the scans of another entry for the same person into this one
+        /// </summary>
+        public void Merge(Person other)
+        {
+            if (!Equals(other))
+                throw new ArgumentException("must be the same person", "other");
+
+            Timestamps = Timestamps.Concat(other.Timestamps).OrderBy(x => x.ScanTime).ToList();
         }
 
         /// <summary>
@@ -213,8 +261,8 @@ namespace ChopshopSignin
         public IDictionary<DateTime, TimeSpan> GetTimeSummary()
         {
             // Get the person's timestamps and group them by week
-            return Timestamps.OrderBy(x => x.ScanTime)
-                             .GroupBy(x => x.ScanTime.Date)
+            // Timestamps are already in time order, and GetDayTotalTime sorts each day anyway
+            return Timestamps.GroupBy(x => x.ScanTime.Date)
                              .ToDictionary(x => x.Key, x => GetDayTotalTime(x));
         }
 
@@ -223,11 +271,22 @@ namespace ChopshopSignin
         /// </summary>
         public TimeSpan GetTotalTimeSince(DateTime startTime)
         {
+            // Read the version before the scans, so a scan added while totalling leaves the stored total out of date
+            var version = System.Threading.Volatile.Read(ref m_ScanVersion);
+
+            // Reuse the previous total if nothing has changed since it was calculated
+            var cached = m_TotalTime;
+            if (cached != null && cached.Item1 == startTime && cached.Item2 == version)
+                return cached.Item3;
+
             // Returns the total time spent since the start time
-            return Timestamps.Where(x => x.ScanTime > startTime)
-                             .GroupBy(x => x.ScanTime.Date)
-                             .Select(x => GetDayTotalTime(x.OrderBy(y => y.ScanTime)))
-                             .Aggregate(TimeSpan.Zero, (accumulator, x) => accumulator.Add(x));
+            // GetDayTotalTime orders each day's scans itself, so they don't need sorting here too
+            var total = Timestamps.Where(x => x.ScanTime > startTime)
+                                  .GroupBy(x => x.ScanTime.Date)
+                                  .Aggregate(TimeSpan.Zero, (accumulator, x) => accumulator.Add(GetDayTotalTime(x)));
+
+            m_TotalTime = Tuple.Create(startTime, version, total);
+            return total;
         }
 
         /// <summary>
@@ -237,7 +296,7 @@ namespace ChopshopSignin
         /// <returns>The time spent that day</returns>
         private TimeSpan GetDayTotalTime(IEnumerable<Scan> scanTimes)
         {
-            var pairs = new List<SignInPair>();
+            var total = TimeSpan.Zero;
             Scan prev = null;
 
             foreach (var scan in scanTimes.OrderBy(x => x.ScanTime))
@@ -245,37 +304,33 @@ namespace ChopshopSignin
                 // If the scan indicates in
                 if (scan.Direction == Scan.LocationType.In)
                 {
-                    // If the there isn't an in scan already
-                    if (prev == null)
-                    {
-                        // Add it
-                        prev = scan;
-                    }
-                    else
-                    {
-                        var t = new SignInPair(new[] { prev });
-                        pairs.Add(t);
-                        prev = scan;
-                    }
+                    // An in scan without a matching out counts as no time, so only the latest one matters
+                    prev = scan;
                 }
                 else if (scan.Direction == Scan.LocationType.Out)
                 {
+                    // Add the time between the in scan and this one
                     if (prev != null)
                     {
-                        var t = new SignInPair(new[] { prev, scan });
-                        pairs.Add(t);
+                        total += scan.ScanTime - prev.ScanTime;
                         prev = null;
                     }
                 }
             }
 
-            if (prev != null)
-            {
-                var t = new SignInPair(new[] { prev });
-                pairs.Add(t);
-            }
+            return total;
+        }
 
-            return pairs.Aggregate(TimeSpan.Zero, (accumulate, x) => accumulate = accumulate.Add(x.TotalTime()));
+        /// <summary>
+        /// Determine if the scans are sorted from oldest to newest
+        /// </summary>
+        private static bool IsInTimeOrder(IList<Scan> scans)
+        {
+            for (int i = 1; i < scans.Count; i++)
+                if (scans[i].ScanTime < scans[i - 1].ScanTime)
+                    return false;
+
+            return true;
         }
 
         /// <summary>
@@ -284,12 +339,7 @@ namespace ChopshopSignin
         private SignInOutResult SignIn()
         {
             if (CurrentLocation == Scan.LocationType.Out)
-            {
-                Timestamps.Add(new Scan(true));
-
-                var statusMessage = string.Format("{0} {1} in at {2}", FirstName, LastName, Timestamps.Last().ScanTime.ToShortTimeString());
-                return new SignInOutResult(true, statusMessage);
-            }
+                return AddScan(true);
             else
             {
                 var statusMessage = "You are already signed in, scan \"OUT\" instead";
@@ -304,12 +354,7 @@ namespace ChopshopSignin
         private SignInOutResult SignOut()
         {
             if (CurrentLocation == Scan.LocationType.In)
-            {
-                Timestamps.Add(new Scan(false));
-
-                var statusMessage = string.Format("{0} {1} out at {2}", FirstName, LastName, Timestamps.Last().ScanTime.ToShortTimeString());
-                return new SignInOutResult(true, statusMessage);
-            }
+                return AddScan(false);
             else
             {
                 var statusMessage = "You are already signed out, scan \"IN\" instead";
@@ -317,6 +362,20 @@ namespace ChopshopSignin
             }
         }
 
+        /// <summary>
+        /// Adds an in or out scan at the current time, and returns the successful sign in/out result
+        /// </summary>
+        /// <param name="signingIn">If true, indicates the person is signing in</param>
+        private SignInOutResult AddScan(bool signingIn)
+        {
+            var scan = new Scan(signingIn);
+            Timestamps.Add(scan);
+            System.Threading.Interlocked.Increment(ref m_ScanVersion);
+
+            var statusMessage = string.Format("{0} {1} {2} at {3}", FirstName, LastName, signingIn ? "in" : "out", scan.ScanTime.ToShortTimeString());
+            return new SignInOutResult(true, statusMessage);
+        }
+
         /// <summary>
         /// Make a backup copy of the specified file a 'Backup' subdirectory
         /// The backup file will be prefixed with yyyy-MM-dd HH_mm_ss
@@ -368,24 +427,16 @@ namespace ChopshopSignin
         }
 
         /// <summary>
-        /// Detects a mentor scan
-        /// </summary>
-        private static bool IsMentor(string rawScanData)
-        {
-            return Regex.IsMatch(rawScanData, MentorIdPattern, RegexOptions.IgnoreCase);
-        }
-
-        /// <summary>
-        /// Returns the mentor name only, stripping out the mentor ID string
+        /// Detects a mentor scan, returning the match of the mentor ID at the start of the scan
+        /// If it isn't a mentor scan, the match will be unsuccessful
         /// </summary>
-        private static string GetMentorName(string rawScanData)
+        private static Match MatchMentorId(string rawScanData)
         {
-            var match = Regex.Match(rawScanData, MentorIdPattern, RegexOptions.IgnoreCase);
-
-            if (!match.Success)
-                throw new ArgumentException("should have a mentor prefix but doesn't", "rawScanData");
+            // Most scans are students, so rule them out with a plain prefix check before running the regex
+            if (!rawScanData.StartsWith(MentorPrefix, StringComparison.OrdinalIgnoreCase))
+                return Match.Empty;
 
-            return rawScanData.Substring(match.Value.Length);
+            return MentorIdRegex.Match(rawScanData);
         }
 
         /// <summary>
@@ -403,8 +454,13 @@ namespace ChopshopSignin
         };
 
         /// <summary>
-        /// The regex pattern to detect a mentor scan
+        /// The literal prefix every mentor scan starts with
+        /// </summary>
+        private const string MentorPrefix = "mentor";
+
+        /// <summary>
+        /// The regex to detect a mentor scan, compiled once since it runs on every scan
         /// </summary>
-        private const string MentorIdPattern = @"\Amentor[^a-z]+";
+        private static readonly Regex MentorIdRegex = new Regex(@"\A" + MentorPrefix + @"[^a-z]+", RegexOptions.IgnoreCase | RegexOptions.Compiled);
     }
 }
\ No newline at end of file
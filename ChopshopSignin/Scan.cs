@@ -35,11 +35,12 @@ namespace ChopshopSignin
             new XElement("Scans", scans.Select(x => x.ToXml())).Save(file);
         }
 
-        public static IEnumerable<Scan> LoadScans(string file)
+        public static IList<Scan> LoadScans(string file)
         {
             return XElement.Load(file)
                            .Elements()
-                           .Select(x => new Scan(x));
+                           .Select(x => new Scan(x))
+                           .ToList();
         }
 
         public override string ToString()
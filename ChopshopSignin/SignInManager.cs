@@ -16,18 +16,28 @@ namespace ChopshopSignin
             : this(externalModel)
         {
             xmlDataFile = dataFile;
-            people = Person.Load(xmlDataFile).ToDictionary(x => x.FullName, x => x);
+
+            foreach (var person in Person.Load(xmlDataFile))
+            {
+                // Entries that only differ by case are the same person, so combine their scans
+                Person existing;
+                if (people.TryGetValue(person.FullName, out existing))
+                    existing.Merge(person);
+                else
+                    people[person.FullName] = person;
+            }
+
             UpdateTotalTime();
         }
 
         public Func<bool> AllOutConfirmation { get; set; }
 
-        public IList<Person> SignedInPeople { get { return SignedIn.ToArray(); } }
+        public IList<Person> SignedInPeople { get { return SignedIn; } }
 
         /// <summary>
         /// True if there is at least one person signed in
         /// </summary>
-        public bool AnySignedIn { get { return SignedIn.Any(); } }
+        public bool AnySignedIn { get { return SignedIn.Count > 0; } }
 
         /// <summary>
         /// Determine if any changes have occurred in the scan data file, and if so,
@@ -83,21 +93,22 @@ namespace ChopshopSignin
                                 Console.Beep();
 
                                 var name = newPerson.FullName;
+                                Person person;
 
                                 // If the person isn't already in the dictionary, add them
-                                if (!people.ContainsKey(name))
-                                    people[name] = newPerson;
-
+                                if (!people.TryGetValue(name, out person))
+                                    people[name] = person = newPerson;
 
-                                var result = people[name].Toggle();
+                                var result = person.Toggle();
 
                                 if (result.OperationSucceeded)
                                 {
                                     // Increment the change count
                                     changeCount++;
+                                    signedInCache = null;
 
                                     // Update the display of who's signed in
-                                    model.UpdateCheckedInList(people.Values);
+                                    model.UpdateCheckedInList(SignedIn);
 
                                     // Save the current list
                                     Commit();
@@ -131,16 +142,18 @@ namespace ChopshopSignin
             // Sign out all signed in users at the current time
             if (confirmAllOutCmd())
             {
-                var remaining = people.Values.Where(x => x.CurrentLocation == Scan.LocationType.In);
-                var status = string.Format("Signed out all {0} remaining at {1}", remaining.Count(), DateTime.Now.ToShortTimeString());
+                var remaining = SignedIn;
+                var status = string.Format("Signed out all {0} remaining at {1}", remaining.Count, DateTime.Now.ToShortTimeString());
 
-                changeCount += remaining.Count();
+                changeCount += remaining.Count;
 
                 foreach (var person in remaining)
                     person.SignInOrOut(false);
 
+                signedInCache = null;
+
                 model.ScanStatus = status;
-                model.UpdateCheckedInList(people.Values);
+                model.UpdateCheckedInList(SignedIn);
             }
             else
                 model.ScanStatus = "Sign everyone out command cancelled";
@@ -156,6 +169,7 @@ namespace ChopshopSignin
                 person.Prune(cutoff);
 
             changeCount++;
+            signedInCache = null;
             //Person.Save(people.Values, xmlDataFile);
         }
 
@@ -189,7 +203,7 @@ namespace ChopshopSignin
             switch (e.PropertyName)
             {
                 case "DoubleScanIgnoreTime":
-                    DoubleScanIgnoreTimeout = TimeSpan.FromDays(settings.DoubleScanIgnoreTime);
+                    DoubleScanIgnoreTimeout = TimeSpan.FromSeconds(settings.DoubleScanIgnoreTime);
                     break;
 
                 case "ScanDataResetTime":
@@ -212,7 +226,8 @@ namespace ChopshopSignin
             : this()
         {
             model = externalModel;
-            people = new Dictionary<string, Person>();
+            // Keyed the same way Person compares names, so a scan finds the same entry regardless of case
+            people = new Dictionary<string, Person>(StringComparer.OrdinalIgnoreCase);
         }
 
         private readonly ViewModel model;
@@ -236,6 +251,10 @@ namespace ChopshopSignin
         private Person lastScan;
         private string xmlDataFile;
 
+        // The people signed in, paired with the day it was worked out for
+        // Cleared whenever scans are added or removed
+        private Tuple<DateTime, IList<Person>> signedInCache;
+
         // Indicates that the object has already been disposed
         private bool disposed = false;
 
@@ -249,7 +268,20 @@ namespace ChopshopSignin
         /// <summary>
         /// People currently signed in
         /// </summary>
-        private IList<Person> SignedIn { get { return people.Values.Where(x => x.CurrentLocation == Scan.LocationType.In).ToReadOnly(); } }
+        private IList<Person> SignedIn
+        {
+            get
+            {
+                // Reuse the list until someone signs in or out, or the day changes and everyone counts as out
+                var cached = signedInCache;
+                if (cached != null && cached.Item1 == DateTime.Today)
+                    return cached.Item2;
+
+                var signedIn = people.Values.Where(x => x.IsSignedIn).ToReadOnly();
+                signedInCache = Tuple.Create(DateTime.Today, signedIn);
+                return signedIn;
+            }
+        }
 
         /// <summary>
         /// Parse the string into the appropriate command
@@ -18,8 +18,6 @@ namespace ChopshopSignin
         {
             var fileName = System.IO.Path.Combine(outputFolder, string.Format("Hour Summary - {0}s.csv", role.ToString()));
 
-            var hourSummaries = people.ToDictionary(x => x.FullName, x => x.GetTimeSummary());
-
             var fileLines = people.Select(x => x.GetTimeSummary()
                                                 .Select(y => new { Name = x.LastName + " " + x.FirstName, Day = y.Key, Time = y.Value }))
                                   .SelectMany(x => x)
@@ -25,7 +25,20 @@ namespace ChopshopSignin
         /// </summary>
         public string CurrentTimeString
         {
-            get { lock (syncObject) { return CurrentTime.ToString("ddd MMM d, yyyy") + Environment.NewLine + CurrentTime.ToLongTimeString(); } }
+            get
+            {
+                lock (syncObject)
+                {
+                    // The date part only changes once a day, so only format it when it does
+                    if (m_CurrentTime.Date != m_CurrentDate)
+                    {
+                        m_CurrentDate = m_CurrentTime.Date;
+                        m_CurrentDateString = m_CurrentDate.ToString("ddd MMM d, yyyy");
+                    }
+
+                    return m_CurrentDateString + Environment.NewLine + m_CurrentTime.ToLongTimeString();
+                }
+            }
         }
 
         /// <summary>
@@ -132,12 +145,26 @@ namespace ChopshopSignin
         /// <param name="people">The list of people</param>
         public void UpdateCheckedInList(IEnumerable<Person> people)
         {
+            var checkedIn = new List<Person>();
+            var students = 0;
+            var mentors = 0;
+
+            // Collect everyone signed in and count each type in a single pass
+            foreach (var person in people.Where(x => x.IsSignedIn))
+            {
+                checkedIn.Add(person);
+
+                if (person.Role == Person.RoleType.Student)
+                    students++;
+                else if (person.Role == Person.RoleType.Mentor)
+                    mentors++;
+            }
+
             // Update the checked in observable
-            CheckedIn = new ObservableCollection<Person>(people.Where(x => x.CurrentLocation == Scan.LocationType.In));
+            CheckedIn = new ObservableCollection<Person>(checkedIn);
 
-            // Get the count of each type
-            StudentsSignedIn = CheckedIn.Count(x => x.Role == Person.RoleType.Student);
-            MentorsSignedIn = CheckedIn.Count(x => x.Role == Person.RoleType.Mentor);
+            StudentsSignedIn = students;
+            MentorsSignedIn = mentors;
         }
 
         public ViewModel()
@@ -171,6 +198,8 @@ namespace ChopshopSignin
 
         private string m_LastScan = string.Empty;
         private DateTime m_CurrentTime = DateTime.Now;
+        private DateTime m_CurrentDate = DateTime.MinValue;
+        private string m_CurrentDateString = string.Empty;
         private int m_StudentsSignedIn;
         private int m_MentorsSignedIn;
         private ObservableCollection<Person> m_CheckedIn = new ObservableCollection<Person>();
@@ -193,11 +222,14 @@ namespace ChopshopSignin
         /// </summary>
         private void ClockTick(object sender, System.Timers.ElapsedEventArgs e)
         {
-            CurrentTime = e.SignalTime;
-
-            if (ShowTimeUntilShip && ShipDate > e.SignalTime)
-                TimeUntilShip = (ShipDate - DateTime.Now).ToString(@"dd\.hh\:mm\:ss");
+            // The clock and ship countdown only show whole seconds, so only update them when the second changes
+            if (e.SignalTime.Ticks / TimeSpan.TicksPerSecond != CurrentTime.Ticks / TimeSpan.TicksPerSecond)
+            {
+                CurrentTime = e.SignalTime;
 
+                if (ShowTimeUntilShip && ShipDate > e.SignalTime)
+                    TimeUntilShip = (ShipDate - DateTime.Now).ToString(@"dd\.hh\:mm\:ss");
+            }
 
             if (eventList.HasExpired(EventList.Event.ClearDisplayStatus, e.SignalTime))
             {